@@ -89,6 +89,7 @@ def build_gui_exe():
             "--icon=printer.ico",  # Sử dụng file .ico đúng chuẩn Windows
             "--add-data=config.json;.",
             "--add-data=printer.png;.",  # Đóng gói luôn file PNG vào exe
+            "--add-data=printer_32.png;.",  # Icon cửa sổ 32x32, không cần resize
             "--hidden-import=pystray",
             "--hidden-import=PIL",
             "--hidden-import=PIL.Image",
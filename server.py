@@ -8,58 +8,123 @@ A comprehensive TCP print server with integrated GUI management and test client
 import os
 import sys
 import time
+import io
 import json
 import socket
+import asyncio
 import threading
+import queue
+import atexit
 import subprocess
 import signal
 import tempfile
+import types
 import logging
-import glob
+import logging.handlers
+import collections
+import functools
+import concurrent.futures
 import psutil
 import winreg
 import traceback
 from datetime import datetime, timedelta
 
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """Queues records for the log thread; writes directly once the thread has stopped"""
+    
+    def enqueue(self, record):
+        if _LOG_LISTENER_RUNNING:
+            self.queue.put_nowait(record)
+        elif _LOG_LISTENER is not None:
+            for handler in _LOG_LISTENER.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+# Log files are written by one background thread so callers only pay for an enqueue
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_QUEUE_HANDLER = _LogQueueHandler(_LOG_QUEUE)
+_LOG_LISTENER = None
+_LOG_LISTENER_RUNNING = False
+
+def attach_queued_logger(logger):
+    """Send a logger's records to the log file and console through the background log thread"""
+    global _LOG_LISTENER, _LOG_LISTENER_RUNNING
+    if _LOG_QUEUE_HANDLER not in logger.handlers:
+        logger.addHandler(_LOG_QUEUE_HANDLER)
+    # The log thread already writes the console too; propagating to the root
+    # handlers would write every record a second time on the caller's thread
+    logger.propagate = False
+    if _LOG_LISTENER is None:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, get_shared_log_handler(), console_handler,
+                                                       respect_handler_level=True)
+        _LOG_LISTENER.start()
+        _LOG_LISTENER_RUNNING = True
+
+def stop_log_listener():
+    """Write out everything still queued and stop the background log thread"""
+    global _LOG_LISTENER_RUNNING
+    if _LOG_LISTENER_RUNNING:
+        _LOG_LISTENER_RUNNING = False
+        _LOG_LISTENER.stop()
+
+# Runs before logging's own atexit flush, so queued records reach their files
+atexit.register(stop_log_listener)
+
+def _ensure_logs_dir():
+    """Create and return the logs directory - use user temp if permission denied"""
+    logs_dir = "logs"
+    try:
+        os.makedirs(logs_dir, exist_ok=True)
+    except PermissionError:
+        # Fallback to user temp directory if permission denied
+        logs_dir = os.path.join(tempfile.gettempdir(), "PrinterOne", "logs")
+        os.makedirs(logs_dir, exist_ok=True)
+    return logs_dir
+
+# Formatter shared by every log file handler; %(name)s tells the loggers apart
+_FMT = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# One log file per launch, shared by the startup, GUI startup and application loggers
+_SHARED_LOG_HANDLER = None
+
+def get_shared_log_handler():
+    """Return the launch's rotating log file handler, creating it on first use"""
+    global _SHARED_LOG_HANDLER
+    # A plain handler is enough: it runs on the log thread, so its per-record
+    # write and flush never happen on a caller's thread
+    if _SHARED_LOG_HANDLER is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_path = os.path.join(_ensure_logs_dir(), f"{timestamp}.log")
+        handler = logging.handlers.RotatingFileHandler(log_path, maxBytes=5 * 1024 * 1024, backupCount=10,
+                                                       encoding='utf-8')
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(_FMT)
+        _SHARED_LOG_HANDLER = handler
+    return _SHARED_LOG_HANDLER
+
 # Setup early logging to capture startup issues
 def setup_early_logging():
     """Setup logging as early as possible to capture startup issues"""
     try:
-        # Create logs directory if it doesn't exist - use user temp if permission denied
-        logs_dir = "logs"
-        try:
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir)
-        except PermissionError:
-            # Fallback to user temp directory if permission denied
-            import tempfile
-            logs_dir = os.path.join(tempfile.gettempdir(), "PrinterOne", "logs")
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir, exist_ok=True)
-        
-        # Generate startup log filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        startup_log_filename = f"{timestamp}_startup.log"
-        startup_log_path = os.path.join(logs_dir, startup_log_filename)
-        
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(startup_log_path, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-        
+        # The root logger only enqueues too, so a record from any logger is a
+        # queue put on the caller's thread and the log thread does the I/O
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        attach_queued_logger(root_logger)
+        
+        # Startup records go to the launch's shared log file, written per record
+        # by the log thread, so a startup crash still leaves its diagnostics
         logger = logging.getLogger('startup')
+        attach_queued_logger(logger)
         logger.info("=== PrinterOne Startup Log ===")
-        logger.info(f"Python version: {sys.version}")
-        logger.info(f"Platform: {sys.platform}")
-        logger.info(f"Current working directory: {os.getcwd()}")
-        logger.info(f"Script path: {os.path.abspath(__file__)}")
-        logger.info(f"Command line arguments: {sys.argv}")
-        logger.info(f"Environment variables: USERPROFILE={os.environ.get('USERPROFILE', 'NOT_SET')}")
+        logger.info("Python version: %s", sys.version)
+        logger.info("Platform: %s", sys.platform)
+        logger.info("Current working directory: %s", os.getcwd())
+        logger.info("Script path: %s", os.path.abspath(__file__))
+        logger.info("Command line arguments: %s", sys.argv)
+        logger.info("Environment variables: USERPROFILE=%s", os.environ.get('USERPROFILE', 'NOT_SET'))
         
         return logger
     except Exception as e:
@@ -85,7 +150,7 @@ try:
             startup_logger.info("GUI modules imported successfully")
     except ImportError as e:
         if startup_logger:
-            startup_logger.error(f"Failed to import GUI modules: {e}")
+            startup_logger.error("Failed to import GUI modules: %s", e)
         raise
     
     # Import Windows-specific modules
@@ -93,32 +158,24 @@ try:
         if startup_logger:
             startup_logger.info("Importing Windows print modules...")
         import win32print
+        import win32api
+        import win32event
+        import winerror
         if startup_logger:
             startup_logger.info("Windows print modules imported successfully")
     except ImportError as e:
         if startup_logger:
-            startup_logger.error(f"Failed to import Windows modules: {e}")
+            startup_logger.error("Failed to import Windows modules: %s", e)
         raise
     
-    # Import PDF generation
-    try:
-        if startup_logger:
-            startup_logger.info("Importing PDF modules...")
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import letter
-        if startup_logger:
-            startup_logger.info("PDF modules imported successfully")
-    except ImportError as e:
-        if startup_logger:
-            startup_logger.error(f"Failed to import PDF modules: {e}")
-        raise
+    # PDF generation (reportlab) is imported lazily by _get_canvas()
 
 except Exception as e:
     error_msg = f"CRITICAL: Import phase failed: {e}"
     if startup_logger:
         startup_logger.critical(error_msg)
-        startup_logger.critical(f"Exception type: {type(e).__name__}")
-        startup_logger.critical(f"Traceback: {traceback.format_exc()}")
+        startup_logger.critical("Exception type: %s", type(e).__name__)
+        startup_logger.critical("Traceback: %s", traceback.format_exc())
     else:
         print(error_msg)
         print(f"Exception type: {type(e).__name__}")
@@ -135,13 +192,198 @@ except ImportError:
     print("pystray not available, system tray disabled")
 
 # Global variables
+# These are single-writer flags read from other threads. Plain bool
+# assignment is atomic under the GIL, so there is no need for a
+# threading.Event here - polling an Event takes its internal lock on every
+# is_set() call. Only use an Event where a timed wait() is actually needed.
 SERVER_RUNNING = True
 AUTO_START_MODE = False
 
+# Main window title
+GUI_WINDOW_TITLE = "PrinterOne - Network Print Server"
+
+# Named auto-reset event a second launch sets to ask the running GUI to show
+# its window; the GUI waits on it and calls its own show_window(), so Tk and
+# the tray keep an accurate idea of whether the window is visible. Lives in the
+# same Global namespace as the instance mutex, so any launch that finds the
+# mutex can also reach the event
+SHOW_WINDOW_EVENT_NAME = "Global\\PrinterOneShowWindow"
+
+# Maps ASCII control bytes (except tab, LF, CR) and DEL to spaces; used by
+# extract_readable_text so cleanup runs in C via bytes.translate. Bytes >= 0x80
+# pass through untouched so UTF-8 sequences survive.
+_PRINTABLE_TABLE = bytes(
+    b if (b >= 32 and b != 127) or b in (9, 10, 13) else 0x20 for b in range(256)
+)
+
+# Maps non-printable bytes to '.' for the ASCII panel of the PDF hex dump
+_ASCII_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
+# Test client print job; only the date between these two parts changes per send
+_TEST_PREFIX = b"""PrinterOne Test Data
+====================
+
+This is a test print job sent from PrinterOne test client.
+Date: """
+_TEST_SUFFIX = b"""
+
+Test content:
+- Line 1: Testing printer functionality
+- Line 2: Checking data transmission
+- Line 3: Verifying print server operation
+- Line 4: Testing raw data handling
+- Line 5: End of test data
+
+If you can see this printed output, the PrinterOne server is working correctly!
+"""
+
+# Print job signatures, longest prefix first so PCL's ESC sequence
+# is not reported as plain ESC/P
+_MAGIC_TABLE = (
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', "Microsoft Office document"),  # OLE2 (.doc, .xls)
+    (b'\x1b%-12345X', "PCL (HP)"),
+    (b'PK\x03\x04', "ZIP archive (possibly Office Open XML)"),  # also .jar, .epub, plain .zip
+    (b'%PDF-', "PDF document"),
+    (b'%!PS', "PostScript"),
+    (b'\x1b', "ESC/P (Epson)"),
+    (b'\x02', "ZPL (Zebra)"),
+)
+
+# _MAGIC_TABLE grouped by first byte (order kept), so a job whose first byte
+# starts no signature falls straight through to the text/binary check
+_MAGIC_DISPATCH = {}
+for _magic, _name in _MAGIC_TABLE:
+    _MAGIC_DISPATCH.setdefault(_magic[:1], []).append((_magic, _name))
+del _magic, _name
+
+@functools.lru_cache(maxsize=64)
+def detect_format_signature(head):
+    """Return the format named by the first bytes of a job, or None"""
+    for magic, name in _MAGIC_DISPATCH.get(head[:1], ()):
+        if head.startswith(magic):
+            return name
+    return None
+
+# ASCII control bytes, space and DEL; a job head with anything left after
+# deleting these holds visible characters and is treated as text
+_NON_VISIBLE_BYTES = bytes(range(33)) + b'\x7f'
+
+def _analyze_fingerprint(head, length):
+    """Describe the format of a job from its first 200 bytes and total length"""
+    if length == 0:
+        return "Empty data"
+    
+    # Check for common printer command formats and document signatures
+    signature = detect_format_signature(head[:16])
+    if signature:
+        return signature
+    
+    if head.translate(None, _NON_VISIBLE_BYTES):
+        return f"Text document ({length} bytes)"
+    return f"Binary/Unknown format ({length} bytes)"
+
+def _get_canvas():
+    """Import reportlab on first use - only the test client's PDF conversion needs it"""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    return canvas, letter
+
+# (second, "HH:MM:SS") of the last log timestamp; replaced as one tuple so threads never see a torn pair
+_LOG_TIMESTAMP = (-1, "")
+
+def _log_timestamp():
+    """Return the current time as HH:MM:SS, calling strftime at most once per second"""
+    global _LOG_TIMESTAMP
+    now = int(time.time())
+    sec, text = _LOG_TIMESTAMP
+    if now != sec:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        _LOG_TIMESTAMP = (now, text)
+    return text
+
+class _EnvLazy:
+    """Formats os.environ only if a log handler actually emits the record"""
+    __slots__ = ()
+    
+    def __str__(self):
+        return repr(dict(os.environ))
+
+# Resolved config.json location, remembered across launches via a pointer file
+_CONFIG_PATH_CACHE = None
+CONFIG_POINTER_FILE = os.path.join(os.environ.get('APPDATA', ''), 'PrinterOne', '.printerone_path')
+
+# Built once and read-only; load_config() hands out a fresh copy
+_DEFAULT_CONFIG = types.MappingProxyType({
+    "printer_name": "",
+    "port": 9100,
+    "use_pdf_conversion": True,
+    "save_pdf_file": False,
+    "auto_start": False,
+    "service_name": "PrinterOne",
+    "service_description": "PrinterOne - Network print server for raw print data",
+    "manual": False,
+    "minimize_to_tray": True,
+    "max_workers": 8,
+    "listen_backlog": socket.SOMAXCONN,
+    "rcvbuf": 1 << 20,
+    "client_timeout": 30
+})
+
+def get_cached_config_path():
+    """Return the last known config.json path, or None if it is unknown or gone"""
+    global _CONFIG_PATH_CACHE
+    if _CONFIG_PATH_CACHE is None and os.environ.get('APPDATA'):
+        try:
+            with open(CONFIG_POINTER_FILE, 'r', encoding='utf-8') as f:
+                _CONFIG_PATH_CACHE = f.read().strip() or None
+        except OSError:
+            pass
+    if _CONFIG_PATH_CACHE and os.path.exists(_CONFIG_PATH_CACHE):
+        return _CONFIG_PATH_CACHE
+    return None
+
+def remember_config_path(config_path):
+    """Remember where config.json lives so the next launch can skip the search"""
+    global _CONFIG_PATH_CACHE
+    if config_path == _CONFIG_PATH_CACHE:
+        return
+    _CONFIG_PATH_CACHE = config_path
+    if not os.environ.get('APPDATA'):
+        return
+    try:
+        os.makedirs(os.path.dirname(CONFIG_POINTER_FILE), exist_ok=True)
+        with open(CONFIG_POINTER_FILE, 'w', encoding='utf-8') as f:
+            f.write(config_path)
+    except OSError:
+        pass
+
+def run_in_daemon_thread(fn, *args, name=None):
+    """Run fn(*args) on a new daemon thread and return a Future for its result
+    
+    For blocking work that may be abandoned on quit (spooler calls, test
+    connections, IP probes): unlike ThreadPoolExecutor workers, daemon threads
+    are not joined when the interpreter exits.
+    """
+    future = concurrent.futures.Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
 class PrinterOneServer:
     """PrinterOne TCP Server"""
     
-    def __init__(self, log_callback=None):
+    LOCAL_IP_PROBE_TIMEOUT = 0.5  # Overall time budget for the local IP probes
+    PRINTERS_CACHE_TTL = 30.0  # Seconds list_printers() reuses its last result
+    
+    def __init__(self, log_callback=None, status_callback=None):
         try:
             if startup_logger:
                 startup_logger.info("Initializing PrinterOneServer...")
@@ -149,12 +391,23 @@ class PrinterOneServer:
             self.config = self.load_config()
             
             if startup_logger:
-                startup_logger.info(f"Configuration loaded: {self.config}")
+                startup_logger.info("Configuration loaded: %s", self.config)
             
-            self.server_socket = None
+            self._loop = None  # Event loop of the running server, if any
+            self._stop_requested = None
+            self._job_slots = None  # Caps concurrent print jobs, created per server run
+            self.stopped_event = threading.Event()  # Set whenever start_server() is not running
+            self.stopped_event.set()
             self.server_thread = None
             self.running = False
             self.log_callback = log_callback  # Callback function for logging to GUI
+            self.status_callback = status_callback  # Called (from any thread) when self.running changes
+            self.local_ip = None  # Address detected when the server started, see refresh_local_ip()
+            self._printers_cache = None
+            self._printers_cache_ts = 0.0
+            self._printer_handle = None  # Kept open across jobs, see print_raw()
+            self._printer_name_cached = None
+            self._printer_lock = threading.Lock()
             
             if startup_logger:
                 startup_logger.info("PrinterOneServer initialized successfully")
@@ -163,9 +416,17 @@ class PrinterOneServer:
             error_msg = f"Failed to initialize PrinterOneServer: {e}"
             if startup_logger:
                 startup_logger.critical(error_msg)
-                startup_logger.critical(f"Traceback: {traceback.format_exc()}")
+                startup_logger.critical("Traceback: %s", traceback.format_exc())
             raise
     
+    def _set_running(self, running):
+        """Update the running flag and notify status_callback if it changed"""
+        if self.running == running:
+            return
+        self.running = running
+        if self.status_callback:
+            self.status_callback()
+    
     def log(self, message):
         """Log message to console and GUI if callback is set"""
         print(message)  # Always print to console
@@ -181,18 +442,6 @@ class PrinterOneServer:
     
     def load_config(self):
         """Load configuration from config.json"""
-        default_config = {
-            "printer_name": "",
-            "port": 9100,
-            "use_pdf_conversion": True,
-            "save_pdf_file": False,
-            "auto_start": False,
-            "service_name": "PrinterOne",
-            "service_description": "PrinterOne - Network print server for raw print data",
-            "manual": False,
-            "minimize_to_tray": True
-        }
-        
         # Try multiple config file locations
         config_paths = [
             'config.json',  # Current directory first
@@ -201,6 +450,14 @@ class PrinterOneServer:
             os.path.join(tempfile.gettempdir(), 'PrinterOne', 'config.json')  # Temp directory
         ]
         
+        # The location found on a previous run is the first fallback; the pointer
+        # file is only read when there is no config.json in the current directory
+        local_config = os.path.abspath('config.json')
+        if not os.path.exists(local_config):
+            cached_path = get_cached_config_path()
+            if cached_path:
+                config_paths.insert(1, cached_path)
+        
         # Store the successful config path for saving
         self.config_path = None
         
@@ -209,35 +466,35 @@ class PrinterOneServer:
                 try:
                     config_path = os.path.abspath(config_path)
                     if startup_logger:
-                        startup_logger.info(f"Trying to load configuration from: {config_path}")
+                        startup_logger.info("Trying to load configuration from: %s", config_path)
                     
                     if os.path.exists(config_path):
                         if startup_logger:
-                            startup_logger.info(f"Config file exists at: {config_path}")
+                            startup_logger.info("Config file exists at: %s", config_path)
                         
                         with open(config_path, 'r') as f:
                             config = json.load(f)
                             
                         if startup_logger:
-                            startup_logger.info(f"Config loaded from file: {config}")
+                            startup_logger.info("Config loaded from file: %s", config)
                         
-                        # Merge with defaults
-                        for key, value in default_config.items():
-                            if key not in config:
-                                config[key] = value
+                        # Merge with defaults; values from the file win
+                        config = {**_DEFAULT_CONFIG, **config}
                                 
                         if startup_logger:
-                            startup_logger.info(f"Final merged config: {config}")
+                            startup_logger.info("Final merged config: %s", config)
                         
                         self.config_path = config_path  # Remember successful path
+                        if config_path != local_config:
+                            remember_config_path(config_path)
                         return config
                 except PermissionError:
                     if startup_logger:
-                        startup_logger.warning(f"Permission denied accessing: {config_path}")
+                        startup_logger.warning("Permission denied accessing: %s", config_path)
                     continue
                 except Exception as e:
                     if startup_logger:
-                        startup_logger.warning(f"Error loading from {config_path}: {e}")
+                        startup_logger.warning("Error loading from %s: %s", config_path, e)
                     continue
             
             # No config file found or accessible
@@ -248,11 +505,11 @@ class PrinterOneServer:
             error_msg = f"Error in config loading process: {e}"
             if startup_logger:
                 startup_logger.error(error_msg)
-                startup_logger.error(f"Traceback: {traceback.format_exc()}")
+                startup_logger.error("Traceback: %s", traceback.format_exc())
             self.log(f"[!] {error_msg}")
         
         if startup_logger:
-            startup_logger.info(f"Using default config: {default_config}")
+            startup_logger.info("Using default config: %s", dict(_DEFAULT_CONFIG))
         
         # Set a fallback config path for saving
         if not self.config_path:
@@ -260,17 +517,16 @@ class PrinterOneServer:
             for base_path in [os.path.expanduser('~'), os.environ.get('APPDATA', ''), tempfile.gettempdir()]:
                 try:
                     config_dir = os.path.join(base_path, 'PrinterOne')
-                    if not os.path.exists(config_dir):
-                        os.makedirs(config_dir, exist_ok=True)
+                    os.makedirs(config_dir, exist_ok=True)
                     self.config_path = os.path.join(config_dir, 'config.json')
                     break
-                except:
+                except OSError:
                     continue
             
             if not self.config_path:
                 self.config_path = os.path.join(tempfile.gettempdir(), 'PrinterOne_config.json')
         
-        return default_config
+        return dict(_DEFAULT_CONFIG)
     
     def save_config(self, printer_name=None, port=None, use_pdf_conversion=None, save_pdf_file=None):
         """Save configuration to config.json"""
@@ -305,7 +561,7 @@ class PrinterOneServer:
                 try:
                     # Ensure directory exists
                     config_dir = os.path.dirname(config_path)
-                    if config_dir and not os.path.exists(config_dir):
+                    if config_dir:
                         os.makedirs(config_dir, exist_ok=True)
                     
                     # Try to save
@@ -314,6 +570,7 @@ class PrinterOneServer:
                     
                     self.log(f"[SAVE] Configuration saved to {config_path}")
                     self.config_path = config_path  # Remember successful path
+                    remember_config_path(os.path.abspath(config_path))
                     return True
                     
                 except PermissionError:
@@ -332,26 +589,42 @@ class PrinterOneServer:
             return False
     
     def list_printers(self):
-        """List all available printers"""
+        """List all available printers (cached for PRINTERS_CACHE_TTL seconds)"""
+        if (self._printers_cache is not None and
+                time.monotonic() - self._printers_cache_ts < self.PRINTERS_CACHE_TTL):
+            return list(self._printers_cache)
+        
         try:
             printers = []
             for printer in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL, None, 1):
                 printers.append(printer[2])
-            return printers
+            self._printers_cache = printers
+            self._printers_cache_ts = time.monotonic()
+            return list(printers)
         except Exception as e:
             self.log(f"[!] Error listing printers: {e}")
             return []
     
+    def invalidate_printers(self):
+        """Forget the cached printer list so the next list_printers() re-enumerates"""
+        self._printers_cache = None
+    
     def convert_raw_to_pdf(self, raw_data, save_file=False):
         """Convert raw data to PDF for testing with PDF printers (test client only)"""
         try:
-            temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-            temp_pdf_path = temp_pdf.name
-            temp_pdf.close()
-            
-            self.log(f"[INFO] Creating PDF at: {temp_pdf_path}")
-            
-            c = canvas.Canvas(temp_pdf_path, pagesize=letter)
+            if detect_format_signature(bytes(raw_data[:16])) == "PDF document":
+                # Already a PDF - rendering it again would only produce a dump of its bytes
+                self.log("[INFO] Data is already a PDF, skipping conversion")
+                pdf_data = bytes(raw_data)
+                if save_file:
+                    self._save_pdf_file(pdf_data)
+                return pdf_data
+            
+            canvas, letter = _get_canvas()
+            
+            # Render into memory; the file is only written when the caller asks to keep it
+            pdf_buffer = io.BytesIO()
+            c = canvas.Canvas(pdf_buffer, pagesize=letter)
             data_format = self.analyze_raw_data(raw_data)
             
             # Add title
@@ -374,29 +647,20 @@ class PrinterOneServer:
                     c.drawString(100, y_position, "Content:")
                     y_position -= 30
                     
-                    # Display text content
-                    c.setFont("Helvetica", 11)
-                    lines = text_content.split('\n')
+                    # Display text content - one text object per page instead of
+                    # a separate drawString (and BT/ET block) per line
+                    text_obj = self._begin_content_text(c, y_position)
                     
-                    for line in lines:
-                        if y_position < 80:
-                            c.showPage()  # New page
-                            y_position = 750
-                        
-                        # Wrap long lines
-                        if len(line) > 80:
-                            for i in range(0, len(line), 80):
-                                chunk = line[i:i+80]
-                                c.drawString(100, y_position, chunk)
-                                y_position -= 15
-                                if y_position < 80:
-                                    c.showPage()
-                                    y_position = 750
-                        else:
-                            c.drawString(100, y_position, line)
-                            y_position -= 15
+                    for line in text_content.split('\n'):
+                        # Wrap long lines (an empty line still takes one row)
+                        for i in range(0, max(len(line), 1), 80):
+                            if text_obj.getY() < 80:
+                                c.drawText(text_obj)
+                                c.showPage()  # New page
+                                text_obj = self._begin_content_text(c, 750)
+                            text_obj.textLine(line[i:i+80])
                     
-                    y_position -= 20
+                    c.drawText(text_obj)
                 else:
                     # If no readable text, show hex and ASCII as before
                     self.add_hex_dump_to_pdf(c, raw_data, y_position)
@@ -406,57 +670,56 @@ class PrinterOneServer:
                 self.add_hex_dump_to_pdf(c, raw_data, y_position)
             
             c.save()
+            pdf_data = pdf_buffer.getvalue()
             
-            # Read the PDF file
-            with open(temp_pdf_path, 'rb') as f:
-                pdf_data = f.read()
-            
-            # Clean up or save file
             if save_file:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                saved_path = f"raw_data_{timestamp}.pdf"
-                os.rename(temp_pdf_path, saved_path)
-                self.log(f"[SAVE] PDF saved as: {saved_path}")
-            else:
-                try:
-                    os.unlink(temp_pdf_path)
-                except:
-                    pass
+                self._save_pdf_file(pdf_data)
             
             return pdf_data
         except Exception as e:
             self.log(f"[!] PDF conversion error: {e}")
             return None
     
+    def _save_pdf_file(self, pdf_data):
+        """Keep a converted PDF as raw_data_<timestamp>.pdf in the current directory"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        saved_path = f"raw_data_{timestamp}.pdf"
+        with open(saved_path, 'wb') as f:
+            f.write(pdf_data)
+        self.log(f"[SAVE] PDF saved as: {saved_path}")
+    
+    def _begin_content_text(self, canvas_obj, y_position):
+        """Start a text object for the content section of a test PDF page"""
+        text_obj = canvas_obj.beginText(100, y_position)
+        text_obj.setFont("Helvetica", 11)
+        text_obj.setLeading(15)
+        return text_obj
+    
+    def _begin_dump_text(self, canvas_obj, y_position):
+        """Start a Courier text object for the hex/ASCII dump; showPage() resets the font, so call once per page"""
+        text_obj = canvas_obj.beginText(100, y_position)
+        text_obj.setFont("Courier", 8)
+        text_obj.setLeading(12)
+        return text_obj
+    
     def extract_readable_text(self, raw_data):
         """Extract readable text from raw data"""
         try:
-            # Try UTF-8 first
-            try:
-                text = raw_data.decode('utf-8')
-                # Clean up control characters but keep printable ones
-                cleaned = ''.join(char if char.isprintable() or char in '\n\r\t' else ' ' for char in text)
-                return cleaned.strip()
-            except UnicodeDecodeError:
-                pass
+            # Clean up control characters before decoding
+            cleaned = raw_data.translate(_PRINTABLE_TABLE)
             
-            # Try Windows-1252 (common in Windows printing)
-            try:
-                text = raw_data.decode('windows-1252', errors='ignore')
-                cleaned = ''.join(char if char.isprintable() or char in '\n\r\t' else ' ' for char in text)
-                return cleaned.strip()
-            except:
-                pass
+            # Plain ASCII (most print data) decodes the same under every codec below
+            if cleaned.isascii():
+                return cleaned.decode('ascii').strip()
             
-            # Try ASCII with error handling
+            # Try UTF-8 first
             try:
-                text = raw_data.decode('ascii', errors='ignore')
-                cleaned = ''.join(char if char.isprintable() or char in '\n\r\t' else ' ' for char in text)
-                return cleaned.strip()
-            except:
+                return cleaned.decode('utf-8').strip()
+            except UnicodeDecodeError:
                 pass
             
-            return None
+            # Fall back to Windows-1252 (common in Windows printing)
+            return cleaned.decode('windows-1252', errors='ignore').strip()
         except Exception as e:
             self.log(f"[WARN] Text extraction error: {e}")
             return None
@@ -472,19 +735,19 @@ class PrinterOneServer:
             y_position -= 30
             
             # Add raw data as hex (first 2000 bytes)
-            canvas_obj.setFont("Courier", 8)
-            hex_data = raw_data[:2000].hex()
+            hex_data = raw_data[:2000]
+            text_obj = self._begin_dump_text(canvas_obj, y_position)
             
-            # Split hex data into lines
-            for i in range(0, len(hex_data), 80):
-                if y_position < 50:
+            # Split hex data into lines of 40 bytes, formatted in C as "xx xx ..."
+            for i in range(0, len(hex_data), 40):
+                if text_obj.getY() < 50:
+                    canvas_obj.drawText(text_obj)
                     canvas_obj.showPage()
-                    y_position = 750
-                
-                line = hex_data[i:i+80]
-                formatted_line = ' '.join([line[j:j+2] for j in range(0, len(line), 2)])
-                canvas_obj.drawString(100, y_position, formatted_line)
-                y_position -= 12
+                    text_obj = self._begin_dump_text(canvas_obj, 750)
+                text_obj.textLine(hex_data[i:i+40].hex(' '))
+            
+            canvas_obj.drawText(text_obj)
+            y_position = text_obj.getY()
             
             # Add ASCII representation
             y_position -= 20
@@ -496,73 +759,50 @@ class PrinterOneServer:
             canvas_obj.drawString(100, y_position, "ASCII representation:")
             y_position -= 20
             
-            canvas_obj.setFont("Courier", 8)
-            ascii_data = raw_data[:1000]
-            ascii_line = ''
-            for i, byte in enumerate(ascii_data):
-                if 32 <= byte <= 126:
-                    ascii_line += chr(byte)
-                else:
-                    ascii_line += '.'
-                
-                if (i + 1) % 80 == 0:
-                    if y_position < 50:
-                        canvas_obj.showPage()
-                        y_position = 750
-                    canvas_obj.drawString(100, y_position, ascii_line)
-                    y_position -= 12
-                    ascii_line = ''
-            
-            if ascii_line:
-                canvas_obj.drawString(100, y_position, ascii_line)
+            ascii_data = raw_data[:1000].translate(_ASCII_TABLE).decode('ascii')
+            text_obj = self._begin_dump_text(canvas_obj, y_position)
+            for i in range(0, len(ascii_data), 80):
+                if text_obj.getY() < 50:
+                    canvas_obj.drawText(text_obj)
+                    canvas_obj.showPage()
+                    text_obj = self._begin_dump_text(canvas_obj, 750)
+                text_obj.textLine(ascii_data[i:i+80])
+            canvas_obj.drawText(text_obj)
                 
         except Exception as e:
             self.log(f"[WARN] Hex dump error: {e}")
     
     def analyze_raw_data(self, data):
         """Analyze raw data to determine format"""
-        if len(data) == 0:
-            return "Empty data"
-        
-        # Check for common printer command formats
-        if data.startswith(b'\x1b'):
-            return "ESC/P (Epson)"
-        elif data.startswith(b'\x1b%-12345X'):
-            return "PCL (HP)"
-        elif data.startswith(b'%!PS'):
-            return "PostScript"
-        elif data.startswith(b'\x02'):
-            return "ZPL (Zebra)"
-        elif b'PDF' in data[:100]:
-            return "PDF document"
-        elif b'Microsoft Office' in data or b'Word' in data or b'.docx' in data or b'.doc' in data:
-            return "Microsoft Office document"
-        elif b'%PDF' in data[:100]:
-            return "PDF format"
-        else:
-            # Try to detect if it contains printable text
-            try:
-                decoded = data.decode('utf-8', errors='ignore')
-                if len(decoded.strip()) > 0 and any(c.isprintable() and c not in '\r\n\t' for c in decoded[:200]):
-                    return f"Text document ({len(data)} bytes)"
-            except:
-                pass
-            
-            return f"Binary/Unknown format ({len(data)} bytes)"
+        return _analyze_fingerprint(bytes(data[:200]), len(data))
     
     def print_raw(self, data, printer_name):
-        """Send raw data to printer"""
+        """Send raw data (bytes or any buffer-protocol object) to printer"""
         try:
-            self.log(f"[INFO] Opening printer: {printer_name}")
-            hPrinter = win32print.OpenPrinter(printer_name)
-            
-            job_info = ("RAW Print Job", None, "RAW")
-            hJob = win32print.StartDocPrinter(hPrinter, 1, job_info)
-            win32print.StartPagePrinter(hPrinter)
-            win32print.WritePrinter(hPrinter, data)
-            win32print.EndPagePrinter(hPrinter)
-            win32print.EndDocPrinter(hPrinter)
-            win32print.ClosePrinter(hPrinter)
+            # WritePrinter reads straight from the buffer, so avoid copying large jobs
+            if not isinstance(data, (bytes, memoryview)):
+                data = memoryview(data)
+            
+            # One job at a time on the shared handle; the spooler queues them anyway
+            with self._printer_lock:
+                if self._printer_handle is None or self._printer_name_cached != printer_name:
+                    self._close_printer_handle()
+                    self.log(f"[INFO] Opening printer: {printer_name}")
+                    self._printer_handle = win32print.OpenPrinter(printer_name)
+                    self._printer_name_cached = printer_name
+                hPrinter = self._printer_handle
+                
+                try:
+                    job_info = ("RAW Print Job", None, "RAW")
+                    hJob = win32print.StartDocPrinter(hPrinter, 1, job_info)
+                    win32print.StartPagePrinter(hPrinter)
+                    win32print.WritePrinter(hPrinter, data)
+                    win32print.EndPagePrinter(hPrinter)
+                    win32print.EndDocPrinter(hPrinter)
+                except Exception:
+                    # The handle may have gone stale (spooler restart, printer removed); reopen next job
+                    self._close_printer_handle()
+                    raise
             
             self.log(f"[OK] Successfully printed {len(data)} bytes.")
             return True
@@ -570,24 +810,29 @@ class PrinterOneServer:
             self.log(f"[!] Print error: {e}")
             return False
     
+    def _close_printer_handle(self):
+        """Close the cached printer handle; the caller holds self._printer_lock"""
+        if self._printer_handle is not None:
+            try:
+                win32print.ClosePrinter(self._printer_handle)
+            except Exception:
+                pass
+            self._printer_handle = None
+            self._printer_name_cached = None
     
-    def handle_client(self, client_socket, address):
-        """Handle a client connection"""
-        self.log(f"[CONN] Client connected: {address}")
+    async def handle_client(self, data, address):
+        """Handle the print job received from a client connection"""
         try:
-            data = b""
-            while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-            
             if data:
                 self.log(f"[DATA] Received {len(data)} bytes from {address}")
-                self.log(f"[INFO] Data format: {self.analyze_raw_data(data)}")
+                data_format = self.analyze_raw_data(data)
+                self.log(f"[INFO] Data format: {data_format}")
                 printer_name = self.config.get("printer_name", "")
                 if printer_name:
-                    self.print_raw(data, printer_name)
+                    # win32print calls block, so keep them off the event loop
+                    async with self._job_slots:
+                        await asyncio.wrap_future(run_in_daemon_thread(
+                            self.print_raw, memoryview(data), printer_name, name="printjob"))
                 else:
                     self.log(f"[!] No printer configured")
             else:
@@ -595,24 +840,22 @@ class PrinterOneServer:
                 
         except Exception as e:
             self.log(f"[!] Error handling client {address}: {e}")
-        finally:
-            client_socket.close()
-            self.log(f"[CONN] Client disconnected: {address}")
     
     def kill_process_on_port(self, port):
         """Kill any process using the specified port"""
         try:
             # Use psutil instead of netstat to avoid snmpapi.dll dependency
-            for conn in psutil.net_connections():
-                if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+            for conn in psutil.net_connections(kind='tcp4'):
+                if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN and conn.pid:
                     try:
                         process = psutil.Process(conn.pid)
                         process.terminate()
                         self.log(f"[KILL] Terminated process {conn.pid} ({process.name()}) using port {port}")
-                        time.sleep(1)
                         
-                        # Force kill if still running
-                        if process.is_running():
+                        # Returns as soon as the process exits; force kill if it is still running
+                        try:
+                            process.wait(timeout=1)
+                        except psutil.TimeoutExpired:
                             process.kill()
                             self.log(f"[KILL] Force killed process {conn.pid}")
                     except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
@@ -620,170 +863,277 @@ class PrinterOneServer:
         except Exception as e:
             self.log(f"[!] Error killing process on port {port}: {e}")
     
-    def get_local_ip(self):
+    def refresh_local_ip(self):
+        """Re-detect the local IP address now and remember it as the server address"""
+        self.local_ip = self._detect_local_ip()
+        return self.local_ip
+    
+    def _detect_local_ip(self):
         """Get the actual local IP address of the machine"""
-        try:
-            # Method 1: Try to connect to a remote server to determine local IP
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            try:
-                # Connect to Google DNS (doesn't actually send data)
-                test_socket.connect(("8.8.8.8", 80))
-                local_ip = test_socket.getsockname()[0]
-                test_socket.close()
-                
-                # Validate that it's not a loopback address or VirtualBox
-                if (not local_ip.startswith('127.') and 
-                    not local_ip.startswith('192.168.56.') and  # VirtualBox Host-Only
-                    not local_ip.startswith('169.254.')):       # APIPA
-                    return local_ip
-            except:
-                test_socket.close()
-            
-            # Method 2: Use psutil to get network interfaces with better filtering
+        # Run all probes at once so a stalled one (firewalled UDP route, slow DNS)
+        # cannot hold up the others; earlier methods still win when they answer in time
+        probes = (self._probe_ip_via_route, self._probe_ip_via_interfaces, self._probe_ip_via_hostname)
+        # Stragglers are left to finish on their own daemon threads
+        futures = [run_in_daemon_thread(probe, name="ip-probe") for probe in probes]
+        deadline = time.monotonic() + self.LOCAL_IP_PROBE_TIMEOUT
+        for future in futures:
             try:
-                import psutil
-                interfaces_with_gw = []
-                interfaces_without_gw = []
-                
-                # Get default gateways to identify primary interfaces
-                gateways = psutil.net_if_stats()
-                
-                for interface_name, interface_addresses in psutil.net_if_addrs().items():
-                    # Skip known virtual interfaces
-                    if any(skip in interface_name.lower() for skip in [
-                        'virtualbox', 'vmware', 'vbox', 'hyper-v', 'loopback', 
-                        'bluetooth', 'isatap', 'teredo', 'tunnel'
-                    ]):
-                        continue
-                    
-                    for address in interface_addresses:
-                        if address.family == socket.AF_INET:
-                            ip = address.address
-                            
-                            # Skip loopback, APIPA, and VirtualBox IPs
-                            if (ip.startswith('127.') or 
-                                ip.startswith('169.254.') or
-                                ip.startswith('192.168.56.')):  # VirtualBox Host-Only
-                                continue
-                            
-                            # Check if this interface is up and running
-                            try:
-                                interface_stats = psutil.net_if_stats().get(interface_name)
-                                if interface_stats and interface_stats.isup:
-                                    # Prefer Wi-Fi and Ethernet over other interfaces
-                                    if any(pref in interface_name.lower() for pref in ['wi-fi', 'wifi', 'ethernet', 'local area']):
-                                        interfaces_with_gw.append((ip, interface_name))
-                                    else:
-                                        interfaces_without_gw.append((ip, interface_name))
-                            except:
-                                pass
-                
-                # Return the best interface
-                if interfaces_with_gw:
-                    # Prefer Wi-Fi over Ethernet if both available
-                    for ip, name in interfaces_with_gw:
-                        if 'wi-fi' in name.lower() or 'wifi' in name.lower():
-                            return ip
-                    # Otherwise return first good interface
-                    return interfaces_with_gw[0][0]
-                
-                if interfaces_without_gw:
-                    return interfaces_without_gw[0][0]
-                    
+                local_ip = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except concurrent.futures.TimeoutError:
+                continue
             except Exception as e:
                 if startup_logger:
-                    startup_logger.warning(f"Method 2 failed: {e}")
-            
-            # Method 3: Fallback to hostname resolution
-            try:
-                hostname = socket.gethostname()
-                local_ip = socket.gethostbyname(hostname)
-                if (not local_ip.startswith('127.') and 
-                    not local_ip.startswith('192.168.56.')):
-                    return local_ip
-            except:
-                pass
-            
-            # Method 4: Last resort - return localhost
-            return '127.0.0.1'
-            
-        except Exception as e:
-            if startup_logger:
-                startup_logger.error(f"Error getting local IP: {e}")
-            return '127.0.0.1'
+                    startup_logger.warning("Local IP probe failed: %s", e)
+                continue
+            if local_ip:
+                return local_ip
+        
+        # Last resort - return localhost
+        return '127.0.0.1'
+    
+    def _probe_ip_via_route(self):
+        """Method 1: Try to connect to a remote server to determine local IP"""
+        test_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            # Connect to Google DNS (doesn't actually send data)
+            test_socket.connect(("8.8.8.8", 80))
+            local_ip = test_socket.getsockname()[0]
+            
+            # Validate that it's not a loopback address or VirtualBox
+            if (not local_ip.startswith('127.') and 
+                not local_ip.startswith('192.168.56.') and  # VirtualBox Host-Only
+                not local_ip.startswith('169.254.')):       # APIPA
+                return local_ip
+        except OSError:
+            pass
+        finally:
+            test_socket.close()
+        return None
+    
+    def _probe_ip_via_interfaces(self):
+        """Method 2: Use psutil to get network interfaces with better filtering"""
+        interfaces_with_gw = []
+        interfaces_without_gw = []
+        
+        # Query interface state once instead of once per address
+        stats = psutil.net_if_stats()
+        
+        for interface_name, interface_addresses in psutil.net_if_addrs().items():
+            # Skip known virtual interfaces
+            if any(skip in interface_name.lower() for skip in [
+                'virtualbox', 'vmware', 'vbox', 'hyper-v', 'loopback', 
+                'bluetooth', 'isatap', 'teredo', 'tunnel'
+            ]):
+                continue
+            
+            for address in interface_addresses:
+                if address.family == socket.AF_INET:
+                    ip = address.address
+                    
+                    # Skip loopback, APIPA, and VirtualBox IPs
+                    if (ip.startswith('127.') or 
+                        ip.startswith('169.254.') or
+                        ip.startswith('192.168.56.')):  # VirtualBox Host-Only
+                        continue
+                    
+                    # Check if this interface is up and running
+                    interface_stats = stats.get(interface_name)
+                    if interface_stats and interface_stats.isup:
+                        # Prefer Wi-Fi and Ethernet over other interfaces
+                        if any(pref in interface_name.lower() for pref in ['wi-fi', 'wifi', 'ethernet', 'local area']):
+                            interfaces_with_gw.append((ip, interface_name))
+                        else:
+                            interfaces_without_gw.append((ip, interface_name))
+        
+        # Return the best interface
+        if interfaces_with_gw:
+            # Prefer Wi-Fi over Ethernet if both available
+            for ip, name in interfaces_with_gw:
+                if 'wi-fi' in name.lower() or 'wifi' in name.lower():
+                    return ip
+            # Otherwise return first good interface
+            return interfaces_with_gw[0][0]
+        
+        if interfaces_without_gw:
+            return interfaces_without_gw[0][0]
+        return None
+    
+    def _probe_ip_via_hostname(self):
+        """Method 3: Fallback to hostname resolution"""
+        hostname = socket.gethostname()
+        local_ip = socket.gethostbyname(hostname)
+        if (not local_ip.startswith('127.') and 
+            not local_ip.startswith('192.168.56.')):
+            return local_ip
+        return None
     
     def start_server(self):
         """Start the TCP print server"""
         global SERVER_RUNNING
         SERVER_RUNNING = True
+        self.stopped_event.clear()
         
         printer_name = self.config.get("printer_name", "")
         port = self.config.get("port", 9100)
         
         if not printer_name:
             self.log("[!] No printer configured!")
+            self.stopped_event.set()
             return False
         
-        # Kill any process using the port first
-        self.log(f"[KILL] Checking for processes using port {port}...")
-        self.kill_process_on_port(port)
+        # The listener is bound without SO_REUSEADDR, which on Windows would let
+        # it share a port another program is listening on. A port in use makes
+        # the bind fail; the process holding it is only evicted with --force
+        if '--force' in sys.argv:
+            self.log(f"[KILL] Checking for processes using port {port}...")
+            self.kill_process_on_port(port)
         
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.settimeout(1.0)
+        try:
+            # Blocks until stop_server() is called; clients are served on this loop
+            if not asyncio.run(self._serve(port, printer_name)):
+                return False
+        except Exception as e:
+            self.log(f"[!] Server error: {e}")
+            return False
+        finally:
+            self.stop_server()
+            # Waits for a job still running on a printjob thread before releasing the printer
+            with self._printer_lock:
+                self._close_printer_handle()
+            # The listener is closed and the event loop is gone
+            self.stopped_event.set()
         
+        return True
+    
+    async def _serve(self, port, printer_name):
+        """Accept clients on an asyncio server until a stop is requested"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_requested = asyncio.Event()
+        # Caps how many blocking spooler calls run at once
+        self._job_slots = asyncio.Semaphore(self.config.get("max_workers", 8))
+        
+        try:
+            server = await self._loop.create_server(lambda: PrintJobProtocol(self), host='0.0.0.0', port=port,
+                                                    backlog=self.config.get("listen_backlog", socket.SOMAXCONN))
+        except OSError as e:
+            self.log(f"[!] Cannot listen on port {port}: {e}")
+            self.log("[!] Another program may be using the port - start with --force to stop it")
+            return False
+        # Accepted sockets inherit the listener's receive buffer; it has to be
+        # set before the handshake for the window scale to allow the full size
+        for sock in server.sockets:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.config.get("rcvbuf", 1 << 20))
+            except OSError:
+                pass
         try:
-            self.server_socket.bind(('0.0.0.0', port))
-            self.server_socket.listen(5)
-            self.running = True
+            # Detect the address once per run; status displays reuse self.local_ip
+            local_ip = self.refresh_local_ip()
+            self._set_running(True)
             
             self.log(f"[OK] Server started on port {port}")
             self.log(f"[PRINTER] Using printer: {printer_name}")
             
-            # Get local IP addresses using improved method
-            local_ip = self.get_local_ip()
             self.log(f"[IP] Local IP: {local_ip}")
             self.log(f"[CONNECT] Other machines can connect to: {local_ip}:{port}")
             
-            while SERVER_RUNNING and self.running:
-                try:
-                    client_socket, address = self.server_socket.accept()
-                    client_thread = threading.Thread(
-                        target=self.handle_client, 
-                        args=(client_socket, address)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        self.log(f"[!] Error accepting client: {e}")
-                    break
-                    
-        except Exception as e:
-            self.log(f"[!] Server error: {e}")
-            return False
+            if SERVER_RUNNING:
+                await self._stop_requested.wait()
+            return True
         finally:
-            self.stop_server()
-        
-        return True
+            # Pending client handlers are cancelled when asyncio.run() returns
+            server.close()
     
     def stop_server(self):
         """Stop the TCP print server"""
         global SERVER_RUNNING
         SERVER_RUNNING = False
-        self.running = False
+        self._set_running(False)
         
-        if self.server_socket:
+        if self._loop:
             try:
-                self.server_socket.close()
-            except:
-                pass
-            self.server_socket = None
+                self._loop.call_soon_threadsafe(self._stop_requested.set)
+            except RuntimeError:
+                pass  # Loop already closed
+            self._loop = None
         
         self.log("[DONE] Server stopped")
 
+class PrintJobProtocol(asyncio.BufferedProtocol):
+    """Receives one print job per connection and hands it to PrinterOneServer"""
+    
+    RECV_SIZE = 65536
+    
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.address = None
+        self.data = bytearray()
+        # The event loop recv_into()s this buffer, so reads don't allocate a bytes per chunk
+        self._recv_buffer = memoryview(bytearray(self.RECV_SIZE))
+        self._job = None
+        self._timeout = server.config.get("client_timeout", 30)
+        self._idle_timer = None
+        self._last_activity = 0.0
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        self.address = transport.get_extra_info('peername')
+        self.server.log(f"[CONN] Client connected: {self.address}")
+        
+        # Print jobs are one-way bulk transfers: disable Nagle (the receive
+        # buffer is sized on the listener, see PrinterOneServer._serve)
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        
+        # Drop clients that stop sending without closing the connection
+        loop = asyncio.get_running_loop()
+        self._last_activity = loop.time()
+        self._idle_timer = loop.call_later(self._timeout, self._check_idle)
+    
+    def _check_idle(self):
+        loop = asyncio.get_running_loop()
+        idle = loop.time() - self._last_activity
+        if idle >= self._timeout:
+            self.server.log(f"[!] Client {self.address} timed out after {self._timeout}s without data")
+            self.transport.abort()
+        else:
+            self._idle_timer = loop.call_later(self._timeout - idle, self._check_idle)
+    
+    def _cancel_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+    
+    def get_buffer(self, sizehint):
+        return self._recv_buffer
+    
+    def buffer_updated(self, nbytes):
+        self.data += self._recv_buffer[:nbytes]
+        self._last_activity = asyncio.get_running_loop().time()
+    
+    def eof_received(self):
+        # Client is done sending - print the job, then close the connection
+        self._cancel_idle_timer()
+        self._job = asyncio.get_running_loop().create_task(self._finish_job())
+        return True
+    
+    async def _finish_job(self):
+        try:
+            await self.server.handle_client(self.data, self.address)
+        finally:
+            self.transport.close()
+    
+    def connection_lost(self, exc):
+        self._cancel_idle_timer()
+        if exc is not None:
+            self.server.log(f"[!] Error handling client {self.address}: {exc}")
+        self.server.log(f"[CONN] Client disconnected: {self.address}")
+
 class TestClient:
     """Test client for the print server"""
     
@@ -824,23 +1174,33 @@ class TestClient:
             log(f"[ERROR] Error: {e}")
             return False
 
+def _compute_manager_cmd():
+    """Build the command line that launches PrinterOne Manager in auto-start mode"""
+    # Check if running from exe (PyInstaller)
+    if hasattr(sys, '_MEIPASS'):
+        # Running from exe - use sys.executable which points to exe
+        exe_path = os.path.abspath(sys.executable)
+        # For exe files, we need to include parameters as part of the command
+        return f'"{exe_path}" gui auto_start'
+    else:
+        # Running from Python script
+        current_script = os.path.abspath(__file__)
+        python_exe = os.path.abspath(sys.executable)
+        return f'"{python_exe}" "{current_script}" gui auto_start'
+
+# The executable and script paths cannot change while the process runs
+_MANAGER_CMD = _compute_manager_cmd()
+
 class AutoStartManager:
     """Windows auto-start management"""
     
+    # Last known (in_startup, path_or_message); only this class changes the entry
+    _cached_status = None
+    
     @staticmethod  
     def find_manager_exe():
         """Find PrinterOne Manager GUI executable"""
-        # Check if running from exe (PyInstaller)
-        if hasattr(sys, '_MEIPASS'):
-            # Running from exe - use sys.executable which points to exe
-            exe_path = os.path.abspath(sys.executable)
-            # For exe files, we need to include parameters as part of the command
-            return f'"{exe_path}" gui auto_start'
-        else:
-            # Running from Python script
-            current_script = os.path.abspath(__file__)
-            python_exe = os.path.abspath(sys.executable)
-            return f'"{python_exe}" "{current_script}" gui auto_start'
+        return _MANAGER_CMD
     
     @staticmethod
     def add_to_startup():
@@ -849,15 +1209,14 @@ class AutoStartManager:
             registry_path = AutoStartManager.find_manager_exe()
             
             # Add to Windows startup registry
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 r"Software\Microsoft\Windows\CurrentVersion\Run",
                 0,
                 winreg.KEY_SET_VALUE
-            )
-            
-            winreg.SetValueEx(key, "PrinterOneManager", 0, winreg.REG_SZ, registry_path)
-            winreg.CloseKey(key)
+            ) as key:
+                winreg.SetValueEx(key, "PrinterOneManager", 0, winreg.REG_SZ, registry_path)
+            AutoStartManager._cached_status = (True, registry_path)
             
             return True, f"PrinterOne Manager added to Windows startup!"
             
@@ -868,15 +1227,14 @@ class AutoStartManager:
     def remove_from_startup():
         """Remove PrinterOne Manager from Windows startup"""
         try:
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 r"Software\Microsoft\Windows\CurrentVersion\Run",
                 0,
                 winreg.KEY_SET_VALUE
-            )
-            
-            winreg.DeleteValue(key, "PrinterOneManager")
-            winreg.CloseKey(key)
+            ) as key:
+                winreg.DeleteValue(key, "PrinterOneManager")
+            AutoStartManager._cached_status = (False, "Not in startup")
             
             return True, "PrinterOne Manager removed from Windows startup!"
             
@@ -886,85 +1244,106 @@ class AutoStartManager:
     @staticmethod
     def check_startup_status():
         """Check if PrinterOne Manager is in startup"""
+        if AutoStartManager._cached_status is not None:
+            return AutoStartManager._cached_status
+        
         try:
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 r"Software\Microsoft\Windows\CurrentVersion\Run",
                 0,
                 winreg.KEY_READ
-            )
-            
-            try:
+            ) as key:
                 value, _ = winreg.QueryValueEx(key, "PrinterOneManager")
-                winreg.CloseKey(key)
-                return True, value
-            except FileNotFoundError:
-                winreg.CloseKey(key)
-                return False, "Not in startup"
-                
+            AutoStartManager._cached_status = (True, value)
+            return AutoStartManager._cached_status
+        
+        except FileNotFoundError:
+            AutoStartManager._cached_status = (False, "Not in startup")
+            return AutoStartManager._cached_status
         except Exception as e:
             return False, f"Error checking startup status: {e}"
 
+# Decoded tray icon, shared by every setup_tray() call
+_TRAY_IMAGE = None
+
+def _load_tray_image(paths):
+    """Decode the first readable tray icon fully into memory (no open file left behind)"""
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                img.load()
+                return img.copy()
+        except Exception:
+            pass
+    
+    # If all fails, create a default icon
+    return Image.new('RGB', (16, 16), color='blue')  # Solid colour, the tray scales it up
+
 class PrinterOneGUI:
     """Integrated GUI for PrinterOne"""
     
+    # Lines inserted per widget on each pump, so a burst cannot stall the Tk thread
+    LOG_PUMP_BATCH = 200
+    TEST_PDF_CACHE_TTL = 60.0  # Seconds a rendered test PDF is reused by send_test_data()
+    
     def __init__(self, root):
-        # Setup GUI initialization logging
+        # Setup GUI initialization logging (opt-in: set PRINTERONE_DEBUG_INIT=1)
         self.init_logger = None
-        try:
-            self.init_logger = logging.getLogger('gui_init')
-            if not self.init_logger.handlers:  # Avoid duplicate handlers
-                self.init_logger.setLevel(logging.INFO)
+        if os.environ.get("PRINTERONE_DEBUG_INIT"):
+            try:
+                self.init_logger = logging.getLogger('gui_init')
+                if not self.init_logger.handlers:  # Avoid duplicate handlers
+                    self.init_logger.setLevel(logging.INFO)
                 
-                # Create logs directory if it doesn't exist - use temp fallback if permission denied
-                logs_dir = "logs"
-                try:
-                    if not os.path.exists(logs_dir):
-                        os.makedirs(logs_dir)
-                except PermissionError:
-                    # Fallback to user temp directory if permission denied
-                    import tempfile
-                    logs_dir = os.path.join(tempfile.gettempdir(), "PrinterOne", "logs")
-                    if not os.path.exists(logs_dir):
-                        os.makedirs(logs_dir, exist_ok=True)
+                    logs_dir = _ensure_logs_dir()
                 
-                # Generate GUI initialization log filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                gui_init_log_filename = f"gui_init_{timestamp}.log"
-                gui_init_log_path = os.path.join(logs_dir, gui_init_log_filename)
+                    # Generate GUI initialization log filename
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    gui_init_log_filename = f"gui_init_{timestamp}.log"
+                    gui_init_log_path = os.path.join(logs_dir, gui_init_log_filename)
                 
-                # Create file handler for GUI initialization log
-                file_handler = logging.FileHandler(gui_init_log_path, encoding='utf-8')
-                file_handler.setLevel(logging.INFO)
+                    # Create file handler for GUI initialization log
+                    file_handler = logging.FileHandler(gui_init_log_path, encoding='utf-8')
+                    file_handler.setLevel(logging.INFO)
                 
-                # Create formatter
-                formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-                file_handler.setFormatter(formatter)
+                    file_handler.setFormatter(_FMT)
                 
-                # Add handler to logger
-                self.init_logger.addHandler(file_handler)
-        except Exception as e:
-            print(f"Error setting up GUI init logging: {e}")
-            self.init_logger = None
+                    # Buffer records in memory; flushed once initialization finishes
+                    self.init_logger.addHandler(logging.handlers.MemoryHandler(capacity=100, target=file_handler))
+            except Exception as e:
+                print(f"Error setting up GUI init logging: {e}")
+                self.init_logger = None
         
         try:
             if self.init_logger:
                 self.init_logger.info("=== PrinterOneGUI Initialization Started ===")
-                self.init_logger.info(f"Tkinter root object: {root}")
+                self.init_logger.info("Tkinter root object: %s", root)
             
             self.root = root
-            self.root.title("PrinterOne - Network Print Server")
+            self.root.title(GUI_WINDOW_TITLE)
             self.root.geometry("1200x700")
             self.root.resizable(True, True)
             
             if self.init_logger:
                 self.init_logger.info("Basic root window configuration completed")
             
+            # Pending log lines, flushed to the log widget from the Tk thread
+            self._log_queue = collections.deque()
+            self._test_log_queue = collections.deque()
+            self._log_lock = threading.Lock()
+            self._log_line_count = 0
+            self._test_log_line_count = 0
+            # Whether each log widget is on the selected notebook tab, see _on_tab_changed()
+            self._log_visible = True
+            self._test_log_visible = False
+            
             # Initialize server with log callback
             if self.init_logger:
                 self.init_logger.info("Initializing PrinterOneServer...")
             
-            self.server = PrinterOneServer(log_callback=self.log_message)
+            self.server = PrinterOneServer(log_callback=self.log_message,
+                                           status_callback=self.on_server_status_changed)
             self.server_thread = None
             
             if self.init_logger:
@@ -978,9 +1357,14 @@ class PrinterOneGUI:
             self.port_var = tk.IntVar(value=self.server.config.get("port", 9100))
             self.test_host_var = tk.StringVar(value="localhost")
             self.test_port_var = tk.IntVar(value=9100)
+            self._pdf_cache = {}  # (printer_name, use_pdf_conversion) -> (pdf_bytes, rendered_at)
+            
+            self._printer_refresh_pending = False  # A background printer enumeration is running
             
             # System tray variables
             self.tray_icon = None
+            self._tray_menu = None  # Built once by _build_tray_menu()
+            self._tray_queue = queue.SimpleQueue()  # Tray menu actions, run on the Tk thread
             self.minimize_to_tray = self.server.config.get("minimize_to_tray", True)
             self.minimize_to_tray_var = tk.BooleanVar(value=self.minimize_to_tray)
             
@@ -1010,6 +1394,16 @@ class PrinterOneGUI:
                 self.init_logger.info("Creating GUI widgets...")
             
             self.create_widgets()
+            self.root.after(50, self._drain_log_queue)
+            
+            # Lets a second launch bring this window back, see activate_existing_gui()
+            try:
+                self._show_event = win32event.CreateEvent(None, False, False, SHOW_WINDOW_EVENT_NAME)
+                threading.Thread(target=self._wait_for_show_requests, name="ShowRequest", daemon=True).start()
+            except Exception as e:
+                self._show_event = None
+                if self.init_logger:
+                    self.init_logger.warning("Could not create the show-window event: %s", e)
             
             if self.init_logger:
                 self.init_logger.info("GUI widgets creation completed")
@@ -1032,18 +1426,9 @@ class PrinterOneGUI:
             if self.init_logger:
                 self.init_logger.info("Window events binding completed")
             
-            # Start status update thread
-            if self.init_logger:
-                self.init_logger.info("Starting status update thread...")
-            
-            self.start_status_thread()
-            
-            if self.init_logger:
-                self.init_logger.info("Status update thread started")
-            
             # Setup system tray
             if self.init_logger:
-                self.init_logger.info(f"Setting up system tray (TRAY_AVAILABLE: {TRAY_AVAILABLE})...")
+                self.init_logger.info("Setting up system tray (TRAY_AVAILABLE: %s)...", TRAY_AVAILABLE)
             
             if TRAY_AVAILABLE:
                 self.setup_tray()
@@ -1055,7 +1440,7 @@ class PrinterOneGUI:
             
             # Auto-start server if configured
             if self.init_logger:
-                self.init_logger.info(f"Checking auto-start configuration (AUTO_START_MODE: {AUTO_START_MODE})...")
+                self.init_logger.info("Checking auto-start configuration (AUTO_START_MODE: %s)...", AUTO_START_MODE)
             
             if AUTO_START_MODE:
                 if self.init_logger:
@@ -1071,7 +1456,7 @@ class PrinterOneGUI:
                 printer_name = self.server.config.get("printer_name", "")
                 if printer_name and printer_name.strip():
                     if self.init_logger:
-                        self.init_logger.info(f"Printer configured ({printer_name}), scheduling auto-start in 1 second")
+                        self.init_logger.info("Printer configured (%s), scheduling auto-start in 1 second", printer_name)
                     self.log_message("Printer configured, auto-starting server...")
                     self.root.after(1000, self.auto_start_server)
                 else:
@@ -1080,15 +1465,16 @@ class PrinterOneGUI:
             
             if self.init_logger:
                 self.init_logger.info("=== PrinterOneGUI Initialization Completed Successfully ===")
+                for handler in self.init_logger.handlers:
+                    handler.flush()
                 
         except Exception as e:
             error_msg = f"Error during GUI initialization: {e}"
             print(error_msg)
+            # init_logger only exists with PRINTERONE_DEBUG_INIT set, so the
+            # traceback is only formatted when someone asked for the trace
             if self.init_logger:
-                self.init_logger.critical(error_msg)
-                self.init_logger.critical(f"Exception type: {type(e).__name__}")
-                import traceback
-                self.init_logger.critical(f"Traceback: {traceback.format_exc()}")
+                self.init_logger.critical("%s (%s)", error_msg, type(e).__name__, exc_info=True)
             
             # Re-raise to maintain original behavior
             raise
@@ -1105,11 +1491,10 @@ class PrinterOneGUI:
     def set_window_icon(self):
         """Set window icon"""
         try:
-            icon_png = self.get_resource_path("printer.png") 
+            # printer_32.png is pre-sized, so Tk can load it without PIL
+            icon_png = self.get_resource_path("printer_32.png")
             if os.path.exists(icon_png):
-                img = Image.open(icon_png)
-                img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
+                photo = tk.PhotoImage(file=icon_png)
                 self.root.iconphoto(True, photo)
         except Exception as e:
             print(f"Error setting window icon: {e}")
@@ -1119,21 +1504,32 @@ class PrinterOneGUI:
         # Main notebook for tabs
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook = notebook
         
         # Server Management Tab
         server_frame = ttk.Frame(notebook)
         notebook.add(server_frame, text="Server Management")
         self.create_server_tab(server_frame)
+        self._server_tab = server_frame
         
         # Test Client Tab
         test_frame = ttk.Frame(notebook)
         notebook.add(test_frame, text="Test Client")
         self.create_test_tab(test_frame)
+        self._test_tab = test_frame
         
         # Settings Tab
         settings_frame = ttk.Frame(notebook)
         notebook.add(settings_frame, text="Settings")
         self.create_settings_tab(settings_frame)
+        
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _on_tab_changed(self, event=None):
+        """Track which log widget is on screen; hidden ones only buffer lines"""
+        selected = self.notebook.select()
+        self._log_visible = selected == str(self._server_tab)
+        self._test_log_visible = selected == str(self._test_tab)
     
     def create_server_tab(self, parent):
         """Create server management tab"""
@@ -1147,8 +1543,10 @@ class PrinterOneGUI:
         
         # Printer selection
         ttk.Label(config_frame, text="Printer:").pack(anchor=tk.W)
-        printer_combo = ttk.Combobox(config_frame, textvariable=self.printer_var, width=40)
-        printer_combo['values'] = self.server.list_printers()
+        printer_combo = ttk.Combobox(config_frame, textvariable=self.printer_var, width=40,
+                                     postcommand=lambda: self.refresh_printer_list(printer_combo))
+        # Filled in the background like a dropdown refresh, so GUI init never enumerates printers
+        self.refresh_printer_list(printer_combo)
         printer_combo.pack(fill=tk.X, pady=(5, 10))
         
         # Port configuration
@@ -1217,6 +1615,26 @@ class PrinterOneGUI:
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
+    def refresh_printer_list(self, combo):
+        """Re-enumerate printers in the background when the dropdown is opened (picks up newly installed ones)"""
+        # EnumPrinters can take seconds with network printers, so it never runs on
+        # the Tk thread; the dropdown shows the current list until the new one is in
+        if self._printer_refresh_pending:
+            return
+        self._printer_refresh_pending = True
+        
+        def run_refresh():
+            self.server.invalidate_printers()
+            printers = self.server.list_printers()
+            self.root.after(0, self._set_printer_values, combo, printers)
+        
+        run_in_daemon_thread(run_refresh, name="gui-task")
+    
+    def _set_printer_values(self, combo, printers):
+        """Fill the printer dropdown with a freshly enumerated list (Tk thread)"""
+        self._printer_refresh_pending = False
+        combo['values'] = printers
+    
     def create_test_tab(self, parent):
         """Create test client tab"""
         # Test configuration frame
@@ -1296,6 +1714,12 @@ Test results will appear here...
             ttk.Label(app_frame, text="(System tray not available - pystray not installed)",
                      font=("Arial", 8), foreground="gray").pack(anchor=tk.W)
         
+        # Network settings
+        network_frame = ttk.LabelFrame(parent, text="Network", padding="10")
+        network_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        ttk.Button(network_frame, text="Refresh IP", command=self.refresh_local_ip).pack(anchor=tk.W)
+        
         # About section
         about_frame = ttk.LabelFrame(parent, text="About", padding="10")
         about_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -1310,37 +1734,84 @@ Includes a GUI management interface and test client with PDF conversion for test
         
         ttk.Label(about_frame, text=about_text, justify=tk.LEFT, font=("Arial", 9)).pack(anchor=tk.W)
     
+    def refresh_local_ip(self):
+        """Re-detect the server's local IP address (e.g. after a network change)"""
+        def run_refresh():
+            local_ip = self.server.refresh_local_ip()
+            self.log_message(f"[IP] Local IP: {local_ip}")
+            self.root.after(0, self.update_server_status)
+        
+        run_in_daemon_thread(run_refresh, name="gui-task")
+    
     def log_test_message(self, message):
-        """Add message to test log"""
-        timestamp = time.strftime("%H:%M:%S")
+        """Add message to test log (safe to call from any thread)"""
+        timestamp = _log_timestamp()
         log_entry = f"[{timestamp}] {message}\n"
         
-        # Add to test log
-        self.test_log_text.insert(tk.END, log_entry)  
-        self.test_log_text.see(tk.END)
-        self.test_log_text.update_idletasks()
-        
-        # Limit test log size
-        if int(self.test_log_text.index('end-1c').split('.')[0]) > 100:
-            self.test_log_text.delete('1.0', '10.0')
+        with self._log_lock:
+            self._test_log_queue.append(log_entry)
     
     def log_message(self, message):
-        """Add message to log"""
-        timestamp = time.strftime("%H:%M:%S")
+        """Add message to log (safe to call from any thread)"""
+        timestamp = _log_timestamp()
         log_entry = f"[{timestamp}] {message}\n"
         
-        # Add to GUI log
-        self.log_text.insert(tk.END, log_entry)  
-        self.log_text.see(tk.END)
-        self.log_text.update_idletasks()
+        # Queue for the GUI log; _drain_log_queue inserts the batch from the Tk thread
+        with self._log_lock:
+            self._log_queue.append(log_entry)
         
         # Also log to file
         if hasattr(self, 'logger'):
             self.logger.info(message)
+    
+    def _take_log_batch(self, queue, visible, max_lines):
+        """Pop up to LOG_PUMP_BATCH entries from a log queue (caller holds _log_lock)"""
+        # Keep only the lines the widget could still show, so the queue stays
+        # bounded even when lines arrive faster than the pump inserts them
+        while len(queue) > max_lines:
+            queue.popleft()
+        if not visible:
+            return []
         
-        # Limit GUI log size
-        if int(self.log_text.index('end-1c').split('.')[0]) > 1000:
-            self.log_text.delete('1.0', '100.0')
+        batch = []
+        while queue and len(batch) < self.LOG_PUMP_BATCH:
+            batch.append(queue.popleft())
+        return batch
+    
+    def _insert_log_batch(self, widget, entries, line_count, max_lines, trim_lines):
+        """Insert entries into a log widget and trim it; returns the new line count"""
+        chunk = "".join(entries)
+        widget.insert(tk.END, chunk)
+        widget.see(tk.END)
+        
+        # Track the line count ourselves instead of asking the widget
+        line_count += chunk.count("\n")
+        if line_count > max_lines:
+            # Drop everything over the cap plus trim_lines of headroom, however
+            # large the batch was, so the widget always ends up under max_lines
+            excess = line_count - max_lines + trim_lines
+            widget.delete('1.0', f'{excess + 1}.0')
+            line_count -= excess
+        return line_count
+    
+    def _drain_log_queue(self):
+        """Flush queued log lines into the visible log widgets and run queued tray actions"""
+        with self._log_lock:
+            entries = self._take_log_batch(self._log_queue, self._log_visible, 1000)
+            test_entries = self._take_log_batch(self._test_log_queue, self._test_log_visible, 100)
+        
+        if entries:
+            self._log_line_count = self._insert_log_batch(
+                self.log_text, entries, self._log_line_count, 1000, 100)
+        
+        if test_entries:
+            self._test_log_line_count = self._insert_log_batch(
+                self.test_log_text, test_entries, self._test_log_line_count, 100, 10)
+        
+        # Tray actions ride on the same tick instead of a timer of their own
+        self._drain_tray_queue()
+        
+        self.root.after(50, self._drain_log_queue)
     
     def save_configuration(self):
         """Save the current configuration"""
@@ -1383,9 +1854,6 @@ Includes a GUI management interface and test client with PDF conversion for test
         
         self.log_message("[START] Starting server...")
         self.update_server_status()
-        
-        # Give server time to start
-        self.root.after(1000, self.update_server_status)
     
     def stop_server(self):
         """Stop the print server"""
@@ -1428,13 +1896,8 @@ Includes a GUI management interface and test client with PDF conversion for test
             self.stop_button.config(state="normal")
             
             port = self.server.config.get("port", 9100)
-            try:
-                local_ip = self.server.get_local_ip()
-                info_text = f"Port: {port} | IP: {local_ip}"
-            except:
-                info_text = f"Port: {port}"
-            
-            self.server_info_label.config(text=info_text)
+            # Detected once when the server started; use "Refresh IP" to re-detect
+            self.server_info_label.config(text=f"Port: {port} | IP: {self.server.local_ip}")
         else:
             self.server_status_label.config(text="[STOP] Server Stopped", foreground="red")
             self.start_button.config(state="normal")
@@ -1487,7 +1950,7 @@ Includes a GUI management interface and test client with PDF conversion for test
             else:
                 self.root.after(0, lambda: self.log_test_message("[ERROR] Connection test failed!"))
         
-        threading.Thread(target=run_test, daemon=True).start()
+        run_in_daemon_thread(run_test, name="gui-task")
     
     def send_test_data(self, data_type):
         """Send test data to server"""
@@ -1495,37 +1958,31 @@ Includes a GUI management interface and test client with PDF conversion for test
         port = self.test_port_var.get()
         
         # Prepare test data (default test data)
-        test_data = b"""PrinterOne Test Data
-====================
-
-This is a test print job sent from PrinterOne test client.
-Date: """ + time.strftime("%Y-%m-%d %H:%M:%S").encode() + b"""
-
-Test content:
-- Line 1: Testing printer functionality
-- Line 2: Checking data transmission
-- Line 3: Verifying print server operation
-- Line 4: Testing raw data handling
-- Line 5: End of test data
-
-If you can see this printed output, the PrinterOne server is working correctly!
-"""
+        test_data = b"".join((_TEST_PREFIX, time.strftime("%Y-%m-%d %H:%M:%S").encode('ascii'), _TEST_SUFFIX))
         
         # Check if target printer is PDF printer and convert data if needed
         printer_name = self.server.config.get("printer_name", "")
         use_pdf_conversion = self.server.config.get("use_pdf_conversion", True)
         
         if printer_name == "Microsoft Print to PDF" and use_pdf_conversion:
-            self.log_test_message(f"[PDF] Converting test data to PDF for PDF printer...")
-            try:
-                pdf_data = self.server.convert_raw_to_pdf(test_data, save_file=False)
-                if pdf_data:
-                    test_data = pdf_data
-                    self.log_test_message(f"[OK] Test data converted to PDF ({len(test_data)} bytes)")
-                else:
-                    self.log_test_message("[WARN] PDF conversion failed, using raw data")
-            except Exception as e:
-                self.log_test_message(f"[WARN] PDF conversion error: {e}")
+            # Reuse a recent render; the printed date may be up to TEST_PDF_CACHE_TTL old
+            cache_key = (printer_name, use_pdf_conversion)
+            cached = self._pdf_cache.get(cache_key)
+            if cached and time.monotonic() - cached[1] < self.TEST_PDF_CACHE_TTL:
+                test_data = cached[0]
+                self.log_test_message(f"[PDF] Reusing converted test PDF ({len(test_data)} bytes)")
+            else:
+                self.log_test_message(f"[PDF] Converting test data to PDF for PDF printer...")
+                try:
+                    pdf_data = self.server.convert_raw_to_pdf(test_data, save_file=False)
+                    if pdf_data:
+                        test_data = pdf_data
+                        self._pdf_cache[cache_key] = (pdf_data, time.monotonic())
+                        self.log_test_message(f"[OK] Test data converted to PDF ({len(test_data)} bytes)")
+                    else:
+                        self.log_test_message("[WARN] PDF conversion failed, using raw data")
+                except Exception as e:
+                    self.log_test_message(f"[WARN] PDF conversion error: {e}")
         
         self.log_test_message(f"[SEND] Sending test data to {host}:{port} ({len(test_data)} bytes)")
         
@@ -1536,19 +1993,11 @@ If you can see this printed output, the PrinterOne server is working correctly!
             else:
                 self.root.after(0, lambda: self.log_test_message("[ERROR] Failed to send test data!"))
         
-        threading.Thread(target=run_test, daemon=True).start()
+        run_in_daemon_thread(run_test, name="gui-task")
     
-    def start_status_thread(self):
-        """Start thread to periodically update status"""
-        def status_updater():
-            while True:
-                try:
-                    self.root.after(0, self.update_server_status) 
-                    time.sleep(2)
-                except:
-                    break
-        
-        threading.Thread(target=status_updater, daemon=True).start()
+    def on_server_status_changed(self):
+        """Refresh the server status display when the server starts or stops (any thread)"""
+        self.root.after(0, self.update_server_status)
     
     def on_closing(self):
         """Handle window closing"""
@@ -1573,17 +2022,18 @@ If you can see this printed output, the PrinterOne server is working correctly!
             if self.server.running:
                 self.log_message("[STOP] Stopping server...")
                 self.server.stop_server()
-                time.sleep(1)
+                self.server.stopped_event.wait(timeout=1.0)
             
             # Stop tray icon
             if TRAY_AVAILABLE and self.tray_icon:
                 try:
                     self.tray_icon.stop()
                     self.log_message("[TRAY] Tray icon stopped")
-                except:
+                except Exception:
                     pass
             
             self.log_message("[OK] Application closed")
+            stop_log_listener()
             self.root.quit()
             self.root.destroy()
             sys.exit(0)
@@ -1597,44 +2047,31 @@ If you can see this printed output, the PrinterOne server is working correctly!
             return
         
         try:
-            # Load icon - try multiple paths
-            tray_image = None
+            # Load icon once per process - bundled resource first, then direct path
+            global _TRAY_IMAGE
+            if _TRAY_IMAGE is None:
+                _TRAY_IMAGE = _load_tray_image((self.get_resource_path("printer.png"), "printer.png"))
+            tray_image = _TRAY_IMAGE
             
-            # Try bundled resource first
-            icon_path = self.get_resource_path("printer.png")
-            try:
-                tray_image = Image.open(icon_path)
-            except Exception:
-                pass
-            
-            # If bundled resource fails, try direct path
-            if tray_image is None:
-                try:
-                    direct_path = "printer.png"
-                    tray_image = Image.open(direct_path)
-                except Exception:
-                    pass
-            
-            # If all fails, create a default icon
-            if tray_image is None:
-                tray_image = Image.new('RGB', (64, 64), color='blue')
+            self.tray_icon = pystray.Icon("PrinterOne", tray_image, "PrinterOne", self._build_tray_menu())
+            threading.Thread(target=self.tray_icon.run, daemon=True).start()
             
-            # Create menu
-            menu = pystray.Menu(
-                pystray.MenuItem("Show Window", self.show_window, default=True),
-                pystray.MenuItem("Hide Window", self.hide_window),
+        except Exception as e:
+            print(f"Error setting up tray: {e}")
+    
+    def _build_tray_menu(self):
+        """Return the tray menu, building it on first use only"""
+        if self._tray_menu is None:
+            self._tray_menu = pystray.Menu(
+                pystray.MenuItem("Show Window", self.show_window_tray, default=True),
+                pystray.MenuItem("Hide Window", self.hide_window_tray),
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem("Start Server", self.start_server_tray),
                 pystray.MenuItem("Stop Server", self.stop_server_tray),
                 pystray.Menu.SEPARATOR,
-                pystray.MenuItem("Quit", self.quit_app)
+                pystray.MenuItem("Quit", self.quit_tray)
             )
-            
-            self.tray_icon = pystray.Icon("PrinterOne", tray_image, "PrinterOne", menu)
-            threading.Thread(target=self.tray_icon.run, daemon=True).start()
-            
-        except Exception as e:
-            print(f"Error setting up tray: {e}")
+        return self._tray_menu
     
     def show_window(self, icon=None, item=None):
         """Show the main window"""
@@ -1646,74 +2083,97 @@ If you can see this printed output, the PrinterOne server is working correctly!
         """Hide window to tray"""
         self.root.withdraw()
     
+    # Tray menu callbacks run on the tray thread; they only queue the action
+    # and _drain_log_queue runs it on the Tk thread
+    def show_window_tray(self, icon=None, item=None):
+        """Show window from tray"""
+        self._tray_queue.put(self.show_window)
+    
+    def hide_window_tray(self, icon=None, item=None):
+        """Hide window from tray"""
+        self._tray_queue.put(self.hide_window)
+    
     def start_server_tray(self, icon=None, item=None):
         """Start server from tray"""
-        self.root.after(0, self.start_server)
+        self._tray_queue.put(self.start_server)
     
     def stop_server_tray(self, icon=None, item=None):
         """Stop server from tray"""
-        self.root.after(0, self.stop_server)
+        self._tray_queue.put(self.stop_server)
+    
+    def quit_tray(self, icon=None, item=None):
+        """Quit from tray"""
+        self._tray_queue.put(self.quit_app)
+    
+    def _wait_for_show_requests(self):
+        """Queue show_window each time another launch sets the show event (own thread)"""
+        while win32event.WaitForSingleObject(self._show_event, win32event.INFINITE) == win32event.WAIT_OBJECT_0:
+            self._tray_queue.put(self.show_window)
+    
+    def _drain_tray_queue(self):
+        """Run every tray action queued since the last tick"""
+        while True:
+            try:
+                action = self._tray_queue.get_nowait()
+            except queue.Empty:
+                break
+            action()
     
     def setup_logging(self):
         """Setup logging system"""
-        # Create logs directory - use temp fallback if permission denied
-        logs_dir = "logs"
-        try:
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir)
-        except PermissionError:
-            # Fallback to user temp directory if permission denied
-            import tempfile
-            logs_dir = os.path.join(tempfile.gettempdir(), "PrinterOne", "logs")
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir, exist_ok=True)
-        
         # Clean old logs
-        self.cleanup_old_logs(logs_dir)
-        
-        # Generate log filename with simple timestamp format
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"{timestamp}.log"
-        log_path = os.path.join(logs_dir, log_filename)
+        self.cleanup_old_logs(_ensure_logs_dir())
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_path, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        # Setup logging - file output goes to the launch's shared log,
+        # console output comes from the root handlers
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.INFO)
+        attach_queued_logger(logger)
         
-        return logging.getLogger(__name__)
+        return logger
     
     def cleanup_old_logs(self, logs_dir, days_to_keep=30):
         """Clean up old log files (retention: 30 days)"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            log_pattern = os.path.join(logs_dir, "*.log")
+            cutoff = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
             
-            for log_file in glob.glob(log_pattern):
-                try:
-                    file_time = datetime.fromtimestamp(os.path.getctime(log_file))
-                    if file_time < cutoff_date:
-                        os.remove(log_file)
-                        print(f"Cleaned up old log: {os.path.basename(log_file)}")
-                except Exception as e:
-                    print(f"Error removing log file {log_file}: {e}")
+            # scandir entries carry the stat info on Windows, so no extra stat per file
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    # Includes rotated backups (e.g. 20250101_120000.log.1)
+                    if not (entry.name.endswith(".log") or ".log." in entry.name):
+                        continue
+                    try:
+                        if entry.is_file() and entry.stat().st_ctime < cutoff:
+                            os.remove(entry.path)
+                            print(f"Cleaned up old log: {entry.name}")
+                    except Exception as e:
+                        print(f"Error removing log file {entry.path}: {e}")
         except Exception as e:
             print(f"Error during log cleanup: {e}")
 
+# Server run by run_console_mode(); signal_handler() stops it instead of exiting
+_CONSOLE_SERVER = None
+# Set by the first Ctrl+C; a second one exits even if the graceful stop is stuck
+_CONSOLE_STOP_REQUESTED = False
+
 def signal_handler(signum, frame):
     """Handle Ctrl+C signal"""
-    global SERVER_RUNNING
+    global SERVER_RUNNING, _CONSOLE_STOP_REQUESTED
     print(f"\n[STOP] Received signal {signum}, stopping...")
     SERVER_RUNNING = False
-    sys.exit(0)
+    if (_CONSOLE_SERVER is not None and not _CONSOLE_STOP_REQUESTED and
+            not _CONSOLE_SERVER.stopped_event.is_set()):
+        # Only wakes the event loop; start_server() closes the listener and returns normally
+        _CONSOLE_STOP_REQUESTED = True
+        _CONSOLE_SERVER.stop_server()
+    else:
+        sys.exit(0)
 
 def run_console_mode():
     """Run in console mode (command line interface)"""
+    global _CONSOLE_SERVER
+    
     # Set up signal handler
     signal.signal(signal.SIGINT, signal_handler)
     
@@ -1722,6 +2182,7 @@ def run_console_mode():
     print()
     
     server = PrinterOneServer()
+    _CONSOLE_SERVER = server
     
     # Check if configuration exists
     config = server.config
@@ -1768,6 +2229,105 @@ def run_console_mode():
     except Exception as e:
         print(f"[!] Server error: {e}")
 
+# Named mutex held for the lifetime of the GUI process; lets later launches
+# tell whether another instance is running without scanning processes
+_INSTANCE_MUTEX = None
+
+def acquire_instance_mutex():
+    """Create the GUI instance mutex; returns True if another instance already holds it"""
+    global _INSTANCE_MUTEX
+    try:
+        _INSTANCE_MUTEX = win32event.CreateMutex(None, False, "Global\\PrinterOneGUI")
+        return win32api.GetLastError() == winerror.ERROR_ALREADY_EXISTS
+    except Exception as e:
+        print(f"Error creating instance mutex: {e}")
+        return True  # Unknown - let the caller fall back to scanning
+
+def activate_existing_gui(show=True):
+    """Ask an already running GUI to show its window; returns False if none was found
+    
+    With show=False (auto-start launches) the running GUI is only detected and
+    left as it is.
+    """
+    try:
+        # Only exists while a GUI is running; that GUI restores itself through
+        # show_window() rather than having its withdrawn window mapped behind Tk's back
+        show_event = win32event.OpenEvent(win32event.EVENT_MODIFY_STATE, False, SHOW_WINDOW_EVENT_NAME)
+    except Exception:
+        return False
+    
+    try:
+        if show:
+            win32event.SetEvent(show_event)
+    except Exception as e:
+        print(f"Error signalling the running instance: {e}")
+        return False
+    finally:
+        show_event.Close()
+    return True
+
+def kill_existing_gui_instances(gui_logger=None):
+    """Terminate other running PrinterOne GUI instances (opt-in via --kill-existing)"""
+    killed_count = 0
+    unconfirmed_exit = False  # A process had to be kill()ed without seeing it exit
+    terminated = []
+    try:
+        if gui_logger:
+            gui_logger.info("Checking for existing GUI instances...")
+        
+        current_pid = os.getpid()
+        # Only names are fetched for every process; reading a command line means
+        # opening the process, so that is done just for python.exe candidates
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                if proc.info['pid'] == current_pid:
+                    continue
+                
+                process_name = (proc.info['name'] or '').lower()
+                if process_name == 'python.exe':
+                    cmdline = proc.cmdline()
+                    is_gui_instance = (any('server.py' in arg for arg in cmdline) and
+                                       any('gui' in arg for arg in cmdline))
+                else:
+                    is_gui_instance = process_name == 'printerone.exe'
+                
+                # Kill other GUI instances - terminate them all first, wait below
+                if is_gui_instance:
+                    if gui_logger:
+                        gui_logger.info("Killing existing instance: %s (PID: %s)", process_name, proc.info['pid'])
+                    proc.terminate()
+                    terminated.append(proc)
+                    killed_count += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        
+        # One shared 3 s window for every instance instead of 3 s each
+        _, alive = psutil.wait_procs(terminated, timeout=3)
+        for proc in alive:
+            try:
+                proc.kill()
+                unconfirmed_exit = True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    except Exception as e:
+        error_msg = f"Error killing existing instances: {e}"
+        print(error_msg)
+        if gui_logger:
+            gui_logger.error(error_msg)
+    
+    if killed_count > 0:
+        info_msg = f"Killed {killed_count} existing GUI instance(s)"
+        print(info_msg)
+        if gui_logger:
+            gui_logger.info(info_msg)
+        # wait() already confirmed terminated processes; only give kill()ed ones time to go
+        if unconfirmed_exit:
+            time.sleep(1)
+    elif gui_logger:
+        gui_logger.info("No existing GUI instances found")
+    
+    return killed_count
+
 def run_gui_mode():
     """Run in GUI mode"""
     global AUTO_START_MODE
@@ -1779,33 +2339,8 @@ def run_gui_mode():
         if not gui_logger.handlers:  # Avoid duplicate handlers
             gui_logger.setLevel(logging.INFO)
             
-            # Create logs directory if it doesn't exist - use temp fallback if permission denied
-            logs_dir = "logs"
-            try:
-                if not os.path.exists(logs_dir):
-                    os.makedirs(logs_dir)
-            except PermissionError:
-                # Fallback to user temp directory if permission denied
-                import tempfile
-                logs_dir = os.path.join(tempfile.gettempdir(), "PrinterOne", "logs")
-                if not os.path.exists(logs_dir):
-                    os.makedirs(logs_dir, exist_ok=True)
-            
-            # Generate GUI startup log filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            gui_startup_log_filename = f"gui_startup_{timestamp}.log"
-            gui_startup_log_path = os.path.join(logs_dir, gui_startup_log_filename)
-            
-            # Create file handler for GUI startup log
-            file_handler = logging.FileHandler(gui_startup_log_path, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            
-            # Create formatter
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
-            
-            # Add handler to logger
-            gui_logger.addHandler(file_handler)
+            # Written to the launch's shared log from the background log thread
+            attach_queued_logger(gui_logger)
     except Exception as e:
         print(f"Error setting up GUI startup logging: {e}")
         gui_logger = None
@@ -1813,57 +2348,33 @@ def run_gui_mode():
     try:
         if gui_logger:
             gui_logger.info("=== GUI Mode Starting ===")
-            gui_logger.info(f"Process ID: {os.getpid()}")
-            gui_logger.info(f"Arguments: {sys.argv}")
+            gui_logger.info("Process ID: %s", os.getpid())
+            gui_logger.info("Arguments: %s", sys.argv)
         
         # Check if this is an auto-start instance (works for both script and exe)
         AUTO_START_MODE = 'auto_start' in sys.argv
         
         if gui_logger:
-            gui_logger.info(f"Auto-start mode: {AUTO_START_MODE}")
-        
-        # Kill existing GUI instances
-        killed_count = 0
-        try:
+            gui_logger.info("Auto-start mode: %s", AUTO_START_MODE)
+        
+        # Killing other instances requires a full process scan, so only do it on
+        # request - and skip it when the instance mutex shows we are the only GUI
+        another_instance = acquire_instance_mutex()
+        if '--kill-existing' in sys.argv:
+            if another_instance:
+                kill_existing_gui_instances(gui_logger)
+            elif gui_logger:
+                gui_logger.info("No other GUI instance holds the instance mutex, skipping process scan")
+        elif another_instance and activate_existing_gui(show=not AUTO_START_MODE):
+            # Hand over to the running GUI instead of starting a second server on the same port;
+            # an auto-start launch leaves its window alone
+            print("PrinterOne GUI is already running")
             if gui_logger:
-                gui_logger.info("Checking for existing GUI instances...")
-            
-            current_pid = os.getpid()
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if proc.info['pid'] == current_pid:
-                        continue
-                    
-                    process_name = proc.info['name'].lower()
-                    cmdline = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
-                    
-                    # Kill other GUI instances
-                    if ((process_name == 'python.exe' and 'server.py' in cmdline and 'gui' in cmdline) or
-                        process_name == 'printerone.exe'):
-                        if gui_logger:
-                            gui_logger.info(f"Killing existing instance: {process_name} (PID: {proc.info['pid']})")
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=3)
-                        except psutil.TimeoutExpired:
-                            proc.kill()
-                        killed_count += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-        except Exception as e:
-            error_msg = f"Error killing existing instances: {e}"
-            print(error_msg)
-            if gui_logger:
-                gui_logger.error(error_msg)
-        
-        if killed_count > 0:
-            info_msg = f"Killed {killed_count} existing GUI instance(s)"
-            print(info_msg)
-            if gui_logger:
-                gui_logger.info(info_msg)
-            time.sleep(1)
-        elif gui_logger:
-            gui_logger.info("No existing GUI instances found")
+                if AUTO_START_MODE:
+                    gui_logger.info("Another GUI instance is running, auto-start launch exits quietly")
+                else:
+                    gui_logger.info("Another GUI instance is running, asked it to show its window")
+            return
         
         # Create and run GUI
         if gui_logger:
@@ -1891,11 +2402,9 @@ def run_gui_mode():
             print(error_msg)
             if gui_logger:
                 gui_logger.critical(error_msg)
-                gui_logger.critical(f"Exception type: {type(e).__name__}")
-                import traceback
-                gui_logger.critical(f"Traceback: {traceback.format_exc()}")
+                gui_logger.critical("Exception type: %s", type(e).__name__)
+                gui_logger.critical("Traceback: %s", traceback.format_exc())
             
-            import traceback
             traceback.print_exc()
             
             # Re-raise for proper error handling
@@ -1906,9 +2415,8 @@ def run_gui_mode():
         print(error_msg)
         if gui_logger:
             gui_logger.critical(error_msg)
-            gui_logger.critical(f"Exception type: {type(e).__name__}")
-            import traceback
-            gui_logger.critical(f"Traceback: {traceback.format_exc()}")
+            gui_logger.critical("Exception type: %s", type(e).__name__)
+            gui_logger.critical("Traceback: %s", traceback.format_exc())
         
         # Re-raise the exception to maintain original behavior
         raise
@@ -1937,6 +2445,8 @@ def show_help():
     print("  python server.py gui          - Run with GUI")
     print("  python server.py gui auto_start - Run GUI in auto-start mode")
     print("  python server.py test         - Run test client")
+    print("  python server.py gui --kill-existing - Terminate other GUI instances first")
+    print("  python server.py gui --force  - Kill any process holding the server port")
     print("  python server.py --help       - Show this help")
     print()
     print("Features:")
@@ -1953,37 +2463,12 @@ def show_help():
 def setup_startup_logging():
     """Setup startup logging to track OS calls and initialization failures"""
     try:
-        # Create logs directory if it doesn't exist - use temp fallback if permission denied
-        logs_dir = "logs"
-        try:
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir)
-        except PermissionError:
-            # Fallback to user temp directory if permission denied
-            import tempfile
-            logs_dir = os.path.join(tempfile.gettempdir(), "PrinterOne", "logs")
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir, exist_ok=True)
-        
-        # Generate startup log filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        startup_log_filename = f"startup_{timestamp}.log"
-        startup_log_path = os.path.join(logs_dir, startup_log_filename)
-        
         # Setup startup logger
         startup_logger = logging.getLogger('startup')
         startup_logger.setLevel(logging.INFO)
         
-        # Create file handler for startup log
-        file_handler = logging.FileHandler(startup_log_path, encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
-        
-        # Create formatter
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        startup_logger.addHandler(file_handler)
+        # Written to the launch's shared log from the background log thread
+        attach_queued_logger(startup_logger)
         
         return startup_logger
     except Exception as e:
@@ -1998,15 +2483,15 @@ def main():
     try:
         if startup_logger:
             startup_logger.info("=== PrinterOne Application Started ===")
-            startup_logger.info(f"Python version: {sys.version}")
-            startup_logger.info(f"Command line arguments: {sys.argv}")
-            startup_logger.info(f"Working directory: {os.getcwd()}")
-            startup_logger.info(f"Executable path: {sys.executable}")
+            startup_logger.info("Python version: %s", sys.version)
+            startup_logger.info("Command line arguments: %s", sys.argv)
+            startup_logger.info("Working directory: %s", os.getcwd())
+            startup_logger.info("Executable path: %s", sys.executable)
             
             # Log if running from exe
             if hasattr(sys, '_MEIPASS'):
-                startup_logger.info(f"Running from PyInstaller exe: {sys.executable}")
-                startup_logger.info(f"Bundle dir: {sys._MEIPASS}")
+                startup_logger.info("Running from PyInstaller exe: %s", sys.executable)
+                startup_logger.info("Bundle dir: %s", sys._MEIPASS)
             else:
                 startup_logger.info("Running from Python script")
         
@@ -2014,7 +2499,7 @@ def main():
             command = sys.argv[1].lower()
             
             if startup_logger:
-                startup_logger.info(f"Command mode: {command}")
+                startup_logger.info("Command mode: %s", command)
             
             if command in ['--help', '-h', 'help']:
                 if startup_logger:
@@ -2030,7 +2515,7 @@ def main():
                 run_test_mode()
             else:
                 if startup_logger:
-                    startup_logger.error(f"Unknown command: {command}")
+                    startup_logger.error("Unknown command: %s", command)
                 print(f"Unknown command: {command}")
                 show_help()
         else:
@@ -2041,7 +2526,7 @@ def main():
                 run_gui_mode()
             except ImportError as e:
                 if startup_logger:
-                    startup_logger.error(f"GUI dependencies not available: {e}")
+                    startup_logger.error("GUI dependencies not available: %s", e)
                     startup_logger.info("Falling back to console mode")
                 print(f"GUI dependencies not available: {e}")
                 print("Running in console mode...")
@@ -2055,9 +2540,8 @@ def main():
         print(error_msg)
         if startup_logger:
             startup_logger.critical(error_msg)
-            startup_logger.critical(f"Exception type: {type(e).__name__}")
-            import traceback
-            startup_logger.critical(f"Traceback: {traceback.format_exc()}")
+            startup_logger.critical("Exception type: %s", type(e).__name__)
+            startup_logger.critical("Traceback: %s", traceback.format_exc())
         
         # Re-raise the exception to maintain original behavior
         raise
@@ -2066,9 +2550,10 @@ if __name__ == "__main__":
     try:
         if startup_logger:
             startup_logger.info("=== Main execution started ===")
-            startup_logger.info(f"OS called application: {sys.executable}")
-            startup_logger.info(f"Arguments passed: {sys.argv}")
-            startup_logger.info(f"Environment: {dict(os.environ)}")
+            startup_logger.info("OS called application: %s", sys.executable)
+            startup_logger.info("Arguments passed: %s", sys.argv)
+            if os.environ.get("PRINTERONE_DEBUG_ENV"):
+                startup_logger.info("Environment: %s", _EnvLazy())
         
         main()
         
@@ -2082,8 +2567,8 @@ if __name__ == "__main__":
         if startup_logger:
             startup_logger.critical("=== CRITICAL APPLICATION FAILURE ===")
             startup_logger.critical(error_msg)
-            startup_logger.critical(f"Exception type: {type(e).__name__}")
-            startup_logger.critical(f"Full traceback: {traceback.format_exc()}")
+            startup_logger.critical("Exception type: %s", type(e).__name__)
+            startup_logger.critical("Full traceback: %s", traceback.format_exc())
             startup_logger.critical("=== END OF CRITICAL FAILURE LOG ===")
         else:
             print(f"Exception type: {type(e).__name__}")